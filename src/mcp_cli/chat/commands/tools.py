@@ -213,11 +213,14 @@ async def tools_manage_command(parts: List[str], ctx: Dict[str, Any]) -> bool:
         if not errors:
             output.print("[green]No validation errors[/green]")
         else:
-            output.print(f"[red]Found {len(errors)} validation errors:[/red]")
-            for error in errors[:10]:  # Show first 10
-                output.print(f"  • {error['tool']}: {error['error']}")
+            lines = [f"[red]Found {len(errors)} validation errors:[/red]"]
+            lines.extend(
+                f"  • {error['tool']}: {error['error']}"
+                for error in errors[:10]  # Show first 10
+            )
             if len(errors) > 10:
-                output.print(f"  ... and {len(errors) - 10} more errors")
+                lines.append(f"  ... and {len(errors) - 10} more errors")
+            output.print("\n".join(lines))
 
     else:
         output.print(f"[red]Unknown tool management command: {command}[/red]")
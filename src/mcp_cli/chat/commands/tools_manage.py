@@ -275,11 +275,13 @@ async def tools_errors_command(parts: List[str], ctx: Dict[str, Any]) -> bool:
         if not errors:
             output.print("[green]No validation errors[/green]")
         else:
-            output.print(f"[red]Found {len(errors)} validation errors:[/red]")
-            for error in errors[:10]:
-                output.print(f"  • {error['tool']}: {error['error']}")
+            lines = [f"[red]Found {len(errors)} validation errors:[/red]"]
+            lines.extend(
+                f"  • {error['tool']}: {error['error']}" for error in errors[:10]
+            )
             if len(errors) > 10:
-                output.print(f"  ... and {len(errors) - 10} more errors")
+                lines.append(f"  ... and {len(errors) - 10} more errors")
+            output.print("\n".join(lines))
 
     except Exception as e:
         output.print(f"[red]Error getting validation errors:[/red] {e}")
@@ -0,0 +1,24 @@
+# mcp_cli/chat/formatting.py
+"""Helpers for choosing how assistant replies are rendered."""
+
+# Characters that can change how Markdown renders a reply; text without any of
+# them (and without a block-level prefix, see below) renders identically as
+# plain Text, which is far cheaper than Markdown
+_MARKDOWN_CHARS = frozenset("#*_`~[]|>&<\\\n")
+_DIGITS = "0123456789"
+
+
+def looks_like_markdown(text: str) -> bool:
+    """Return True if *text* may need the Markdown renderer."""
+    if not _MARKDOWN_CHARS.isdisjoint(text):
+        return True
+
+    # Block-level syntax that needs no special character: indented code,
+    # bullet lists / rules ("- x", "+ x", "---") and ordered lists ("1. x")
+    stripped = text.lstrip()
+    if stripped != text:
+        return True
+    if stripped.startswith(("-", "+")):
+        return True
+    digits = len(stripped) - len(stripped.lstrip(_DIGITS))
+    return digits > 0 and stripped[digits : digits + 1] in (".", ")")
@@ -20,6 +20,7 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.markdown import Markdown
 
+from mcp_cli.chat.formatting import looks_like_markdown
 from mcp_cli.logging_config import get_logger
 
 logger = get_logger("streaming")
@@ -42,6 +43,12 @@ class StreamingResponseHandler:
         self._accumulated_tool_calls = []
         self._current_tool_call = None
 
+        # Chunk type -> content extractor
+        self._content_extractors = {
+            dict: self._extract_dict_chunk_content,
+            str: str,
+        }
+
     async def stream_response(
         self,
         client,
@@ -126,8 +133,11 @@ class StreamingResponseHandler:
 
         # Format content
         try:
-            # Use Markdown for formatted text
-            content = Markdown(self.current_response)
+            # Use Markdown for formatted text; plain prose renders the same as Text
+            if looks_like_markdown(self.current_response):
+                content = Markdown(self.current_response)
+            else:
+                content = Text(self.current_response)
         except Exception as e:
             # Fallback to Text if Markdown parsing fails
             logger.debug(f"Markdown parsing failed: {e}")
@@ -269,9 +279,11 @@ class StreamingResponseHandler:
     def _start_live_display(self):
         """Start the live display for streaming updates."""
         if not self.live_display:
+            # Rendering is pulled by Live's refresh thread via get_renderable,
+            # so the chunk loop never builds or writes a frame itself.
             self.live_display = Live(
-                self._create_display_content(),
                 console=self.console,
+                get_renderable=self._create_display_content,
                 transient=True,
                 refresh_per_second=4,  # 10 FPS for smooth updates
                 vertical_overflow="visible",
@@ -299,12 +311,9 @@ class StreamingResponseHandler:
                 logger.debug(f"Extracted tool call data: {tool_call_data}")
                 self._process_tool_call_chunk(tool_call_data, tool_calls)
 
-            # Update live display
-            if self.live_display and not self._interrupted:
-                self.live_display.update(self._create_display_content())
-
-            # Small delay to prevent overwhelming the terminal
-            await asyncio.sleep(0.01)
+            # Yield to the event loop; the live display redraws on its own
+            # refresh cadence rather than once per chunk
+            await asyncio.sleep(0)
 
         except Exception as e:
             logger.warning(f"Error processing chunk: {e}")
@@ -313,35 +322,45 @@ class StreamingResponseHandler:
     def _extract_chunk_content(self, chunk: Dict[str, Any]) -> str:
         """Extract text content from a chuk-llm streaming chunk."""
         try:
-            # chuk-llm streaming format - chunk has "response" field with content
-            if isinstance(chunk, dict):
-                # Primary format for chuk-llm
-                if "response" in chunk:
-                    return (
-                        str(chunk["response"]) if chunk["response"] is not None else ""
-                    )
-
-                # Alternative formats (for compatibility)
-                elif "content" in chunk:
-                    return str(chunk["content"])
-                elif "text" in chunk:
-                    return str(chunk["text"])
-                elif "delta" in chunk and isinstance(chunk["delta"], dict):
-                    delta_content = chunk["delta"].get("content")
-                    return str(delta_content) if delta_content is not None else ""
-                elif "choices" in chunk and chunk["choices"]:
-                    choice = chunk["choices"][0]
-                    if "delta" in choice and "content" in choice["delta"]:
-                        delta_content = choice["delta"]["content"]
-                        return str(delta_content) if delta_content is not None else ""
-            elif isinstance(chunk, str):
-                return chunk
+            # Exact-type dispatch; subclasses fall back to isinstance below
+            extractor = self._content_extractors.get(type(chunk))
+            if extractor is None:
+                if isinstance(chunk, dict):
+                    extractor = self._extract_dict_chunk_content
+                elif isinstance(chunk, str):
+                    extractor = str
+                else:
+                    return ""
+            return extractor(chunk)
 
         except Exception as e:
             logger.debug(f"Error extracting content from chunk: {e}")
 
         return ""
 
+    @staticmethod
+    def _extract_dict_chunk_content(chunk: Dict[str, Any]) -> str:
+        """Extract text content from a dict-shaped streaming chunk."""
+        # Primary format for chuk-llm
+        if "response" in chunk:
+            return str(chunk["response"]) if chunk["response"] is not None else ""
+
+        # Alternative formats (for compatibility)
+        elif "content" in chunk:
+            return str(chunk["content"])
+        elif "text" in chunk:
+            return str(chunk["text"])
+        elif "delta" in chunk and isinstance(chunk["delta"], dict):
+            delta_content = chunk["delta"].get("content")
+            return str(delta_content) if delta_content is not None else ""
+        elif "choices" in chunk and chunk["choices"]:
+            choice = chunk["choices"][0]
+            if "delta" in choice and "content" in choice["delta"]:
+                delta_content = choice["delta"]["content"]
+                return str(delta_content) if delta_content is not None else ""
+
+        return ""
+
     def _extract_tool_calls_from_chunk(
         self, chunk: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -748,7 +767,10 @@ class StreamingResponseHandler:
                 display_text = self.current_response
                 if not self._interrupted:
                     display_text += " ▌"  # Add typing cursor
-                response_content = Markdown(markup=display_text)
+                if looks_like_markdown(display_text):
+                    response_content = Markdown(markup=display_text)
+                else:
+                    response_content = Text(display_text)
             except Exception as e:
                 # Fallback to plain text if markdown fails
                 logger.debug(f"Markdown rendering failed: {e}")
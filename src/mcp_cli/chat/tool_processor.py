@@ -202,7 +202,11 @@ class ToolProcessor:
                     and hasattr(self.ui_manager, "verbose_mode")
                     and self.ui_manager.verbose_mode
                 ):
-                    display_tool_call_result(tool_result, self.ui_manager.console)
+                    display_tool_call_result(
+                        tool_result,
+                        self.ui_manager.console,
+                        content=content if tool_result.success else None,
+                    )
 
             except asyncio.CancelledError:
                 raise
@@ -15,14 +15,14 @@ Key improvements
 
 from __future__ import annotations
 
+import asyncio
 import json
 import signal
 import time
 import logging
-import re
 
 from types import FrameType
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
@@ -33,14 +33,61 @@ from chuk_term.ui import output
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.style import Style as RichStyle
 from rich.text import Text
 
 from mcp_cli.chat.command_completer import ChatCommandCompleter
 from mcp_cli.chat.commands import handle_command
+from mcp_cli.chat.formatting import looks_like_markdown
 
 # Set up logger
 log = logging.getLogger(__name__)
 
+# Fixed display constants, built once at import rather than per manager/refresh
+_PROMPT_STYLE = Style.from_dict(
+    {
+        "completion-menu": "bg:default",
+        "completion-menu.completion": "bg:default fg:goldenrod",
+        "completion-menu.completion.current": "bg:default fg:goldenrod bold",
+        "auto-suggestion": "fg:ansibrightblack",
+    }
+)
+_SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+_TOOL_CHAIN_SEPARATOR = " → "
+
+# Styles for the compact tool progress line, which is rebuilt on every refresh;
+# assembling Text from these skips Rich's markup parser entirely.
+_DONE_TOOL_STYLE = RichStyle.parse("dim green")
+_CURRENT_TOOL_STYLE = RichStyle.parse("magenta")
+_TOOL_HEADER_STYLE = RichStyle.parse("dim")
+
+# Reasoning blocks emitted by thinking models, stripped from final answers
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+def _strip_think_tags(text: str) -> str:
+    """Remove ``<think>...</think>`` blocks in a single linear pass.
+
+    An unterminated ``<think>`` is left in place, matching the non-greedy
+    regex this replaces, but without rescanning the tail for every opener.
+    """
+    out: List[str] = []
+    i, n = 0, len(text)
+    while i < n:
+        j = text.find(_THINK_OPEN, i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        k = text.find(_THINK_CLOSE, j + len(_THINK_OPEN))
+        if k < 0:
+            out.append(text[i:])
+            break
+        out.append(text[i:j])
+        i = k + len(_THINK_CLOSE)
+    return "".join(out)
+
 
 class ChatUIManager:
     """Interactive UI layer with progress display and streaming support."""
@@ -50,38 +97,39 @@ class ChatUIManager:
         self.context = context
         self.console = output._console
 
-        self.verbose_mode = True
+        self._verbose_mode = True
         self.tools_running = False
         self.interrupt_requested = False
-        self.confirm_tool_execution = True  # Whether to confirm tool execution
+        self._confirm_tool_execution = True  # Whether to confirm tool execution
+        self._select_tool_call_renderer()
 
         # Streaming response state
         self.is_streaming_response = False
         self.streaming_handler: Optional[Any] = None
 
         self.tool_calls: List[Dict[str, Any]] = []
+        # name -> description, rebuilt only when context.tools is replaced
+        self._tool_descriptions: Dict[str, str] = {}
+        self._tool_descriptions_source: Optional[List[Dict[str, Any]]] = None
         self.tool_times: List[float] = []
         self.tool_start_time: float | None = None
         self.current_tool_start_time: float | None = None
 
         self.live_display: Live | None = None
-        self.spinner_frames = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        self.spinner_frames = _SPINNER_FRAMES
         self.spinner_idx = 0
 
         self._prev_sigint_handler: signal.Handlers | None = None
         self._interrupt_count = 0
         self._last_interrupt_time = 0
 
-        try:
-            style = Style.from_dict(
-                {
-                    "completion-menu": "bg:default",
-                    "completion-menu.completion": "bg:default fg:goldenrod",
-                    "completion-menu.completion.current": "bg:default fg:goldenrod bold",
-                    "auto-suggestion": "fg:ansibrightblack",
-                }
-            )
+        # Repeated Ctrl-C presses would otherwise re-print the same status
+        # line; the last one is remembered until the next stream, tool batch
+        # or user turn starts.
+        self._dedupe_status = True
+        self._last_status: Optional[str] = None
 
+        try:
             # Before initializing PromptSession - use centralized preferences
             from mcp_cli.utils.preferences import get_preference_manager
 
@@ -93,7 +141,7 @@ class ChatUIManager:
                 auto_suggest=AutoSuggestFromHistory(),
                 completer=ChatCommandCompleter(context.to_dict()),
                 complete_while_typing=True,
-                style=style,
+                style=_PROMPT_STYLE,
                 message="> ",
             )
         except Exception as e:
@@ -103,17 +151,42 @@ class ChatUIManager:
 
         self.last_input: str | None = None
 
+    # ───────────────────────────── display modes ─────────────────────────────
+    @property
+    def verbose_mode(self) -> bool:
+        return self._verbose_mode
+
+    @verbose_mode.setter
+    def verbose_mode(self, value: bool) -> None:
+        self._verbose_mode = value
+        self._select_tool_call_renderer()
+
+    @property
+    def confirm_tool_execution(self) -> bool:
+        return self._confirm_tool_execution
+
+    @confirm_tool_execution.setter
+    def confirm_tool_execution(self, value: bool) -> None:
+        self._confirm_tool_execution = value
+        self._select_tool_call_renderer()
+
+    def _select_tool_call_renderer(self) -> None:
+        """Bind the tool-call renderer for the current mode once, not per call."""
+        if self._verbose_mode or self._confirm_tool_execution:
+            self._render_tool_call = self._print_tool_call_panel
+        else:
+            self._render_tool_call = self._print_tool_call_compact
+
     # ───────────────────────────── Streaming coordination ──────────────────
     def start_streaming_response(self):
         """Signal that a streaming response is starting."""
         self.is_streaming_response = True
+        self._last_status = None
         log.debug("Started streaming response")
 
     def do_confirm_tool_execution(self) -> bool:
         """Prompt user to confirm tool execution with rich text and clear default."""
         try:
-            from rich.prompt import Prompt
-
             # Use rich to display the prompt, fallback to input() if needed
             prompt_text = "[bold white]Do you want to execute the tool?[/bold white]"
             try:
@@ -189,7 +262,9 @@ class ChatUIManager:
 
                     # Handle streaming response interruption
                     if self.is_streaming_response:
-                        print("\n[yellow]Interrupting streaming response...[/yellow]")
+                        self._print_status(
+                            "\n[yellow]Interrupting streaming response...[/yellow]"
+                        )
                         self.interrupt_streaming()
                         return
 
@@ -198,7 +273,7 @@ class ChatUIManager:
                         if self.tools_running and not self.interrupt_requested:
                             # First interrupt - try graceful cancel
                             self.interrupt_requested = True
-                            print(
+                            self._print_status(
                                 "\n[yellow]Interrupt requested - cancelling current "
                                 "tool execution…[/yellow]"
                             )
@@ -211,11 +286,13 @@ class ChatUIManager:
 
                         # Second interrupt within 2 seconds - more forceful termination
                         if self.tools_running and self._interrupt_count >= 2:
-                            print("\n[red]Force terminating current operation...[/red]")
+                            self._print_status(
+                                "\n[red]Force terminating current operation...[/red]"
+                            )
                             # Try to force cleanup
                             try:
                                 self.stop_tool_calls()
-                                print(
+                                self._print_status(
                                     "[yellow]Tool execution forcefully stopped.[/yellow]"
                                 )
                             except Exception as force_exc:
@@ -267,6 +344,28 @@ class ChatUIManager:
             log.error(f"Error in _restore_sigint_handler: {exc}")
 
     # ───────────────────────────── helpers ─────────────────────────────
+    def _print_status(self, message: str) -> None:
+        """Print a status line unless it repeats the previous one."""
+        if self._dedupe_status and message == self._last_status:
+            return
+        self._last_status = message
+        print(message)
+
+    @staticmethod
+    def _print_lines(*lines: str) -> None:
+        """Emit several lines with a single print call."""
+        print("\n".join(lines))
+
+    def _get_tool_description(self, tool_name: str) -> Optional[str]:
+        """Look up a tool's description, caching the index per tools list."""
+        tools = self.context.tools
+        if tools is not self._tool_descriptions_source:
+            self._tool_descriptions = {
+                obj.get("name"): obj.get("description", "") for obj in tools
+            }
+            self._tool_descriptions_source = tools
+        return self._tool_descriptions.get(tool_name.split(".", 1)[-1])
+
     def _get_spinner_char(self) -> str:
         """Get the next spinner frame with error handling."""
         try:
@@ -327,8 +426,6 @@ class ChatUIManager:
         try:
             if self.session is None:
                 # Fallback to basic input if prompt_toolkit not available
-                import asyncio
-
                 user_input = await asyncio.to_thread(input, "> ")
                 self.last_input = user_input.strip()
                 return self.last_input
@@ -343,8 +440,6 @@ class ChatUIManager:
         except Exception as exc:
             log.error(f"Error getting user input: {exc}")
             # Last resort fallback
-            import asyncio
-
             try:
                 return await asyncio.to_thread(input, "> ")
             except Exception:
@@ -356,14 +451,14 @@ class ChatUIManager:
             # Use Text object to prevent markup issues
             message_text = Text(message or "[No Message]")
             print(Panel(message_text, style="bold yellow", title="You"))
+            self._last_status = None
             self.tool_calls.clear()
             if not self.verbose_mode:
                 self.live_display = None
         except Exception as exc:
             log.error(f"Error printing user message: {exc}")
             # Fallback to plain text
-            print("\n[yellow]You:[/yellow]")
-            print(message or "[No Message]")
+            self._print_lines("\n[yellow]You:[/yellow]", message or "[No Message]")
 
     def print_tool_call(self, tool_name: str, raw_args):
         """Display a tool call in the UI, with improved error handling."""
@@ -372,6 +467,7 @@ class ChatUIManager:
             if not self.tool_start_time:
                 self.tool_start_time = time.time()
                 self.tools_running = True
+                self._last_status = None
                 try:
                     self._install_sigint_handler()
                 except Exception as sig_exc:
@@ -408,59 +504,68 @@ class ChatUIManager:
                 return
 
             # Display according to current mode
-            if self.verbose_mode or self.confirm_tool_execution:
-                try:
-                    # Format arguments safely
-                    try:
-                        args_json = json.dumps(processed_args, indent=2)
-                    except Exception:
-                        args_json = str(processed_args)
-                    md = f"**Tool Call:** {tool_name}\n\n```json\n{args_json}\n```"
-
-                    # Get tool description in verbose mode
-                    if self.verbose_mode:
-                        tool_description = ""
-                        for obj in self.context.tools:
-                            if obj.get("name") == tool_name.split(".", 1)[-1]:
-                                tool_description = obj.get("description", "")
-                                md = f"Tool Call: **{tool_name}**\n\n*{tool_description}*\n```json\n{args_json}\n```"
-
-                    # Use a safe approach to display markdown
-                    try:
-                        markdown_content = Markdown(md)
-                        print(
-                            Panel(
-                                markdown_content,
-                                style="bold magenta",
-                                title="Tool Invocation",
-                            )
-                        )
-                    except Exception:
-                        # Fallback if markdown parsing fails
-                        message_text = Text(f"Tool Call: {tool_name}\n\n{args_json}")
-                        print(
-                            Panel(
-                                message_text,
-                                style="bold magenta",
-                                title="Tool Invocation",
-                            )
-                        )
-                except Exception:
-                    # Fallback to plain display if formatting fails
-                    print(f"[magenta]Tool Call:[/magenta] {tool_name}")
-                    print(f"[dim]Arguments:[/dim] {str(processed_args)}")
-            else:
-                try:
-                    self._display_compact_tool_calls()
-                except Exception as display_exc:
-                    log.error(f"Error in compact display: {display_exc}")
-                    # Fallback to simple display if compact view fails
-                    print(f"[magenta]Running tool:[/magenta] {tool_name}")
+            self._render_tool_call(tool_name, processed_args)
         except Exception as exc:
             # Last-resort error handler
             log.error(f"Error displaying tool call: {exc}")
-            print(f"[yellow]Warning: Error displaying tool call: {exc}[/yellow]")
-            print(f"Running tool: {tool_name}")
+            self._print_lines(
+                f"[yellow]Warning: Error displaying tool call: {exc}[/yellow]",
+                f"Running tool: {tool_name}",
+            )
+
+    def _print_tool_call_panel(self, tool_name: str, processed_args) -> None:
+        """Render a tool call as a full panel (verbose / confirm modes)."""
+        try:
+            # Format arguments safely
+            try:
+                args_json = json.dumps(processed_args, indent=2)
+            except Exception:
+                args_json = str(processed_args)
+
+            # Pick the header first so the (possibly large) JSON is copied
+            # into the markdown source only once
+            header = f"**Tool Call:** {tool_name}\n\n"
+            if self._verbose_mode:
+                tool_description = self._get_tool_description(tool_name)
+                if tool_description is not None:
+                    header = f"Tool Call: **{tool_name}**\n\n*{tool_description}*\n"
+            md = f"{header}```json\n{args_json}\n```"
+
+            # Use a safe approach to display markdown
+            try:
+                markdown_content = Markdown(md)
+                print(
+                    Panel(
+                        markdown_content,
+                        style="bold magenta",
+                        title="Tool Invocation",
+                    )
+                )
+            except Exception:
+                # Fallback if markdown parsing fails
+                message_text = Text(f"Tool Call: {tool_name}\n\n{args_json}")
+                print(
+                    Panel(
+                        message_text,
+                        style="bold magenta",
+                        title="Tool Invocation",
+                    )
+                )
+        except Exception:
+            # Fallback to plain display if formatting fails
+            self._print_lines(
+                f"[magenta]Tool Call:[/magenta] {tool_name}",
+                f"[dim]Arguments:[/dim] {str(processed_args)}",
+            )
+
+    def _print_tool_call_compact(self, tool_name: str, processed_args) -> None:
+        """Render a tool call in the compact live view."""
+        try:
+            self._display_compact_tool_calls()
+        except Exception as display_exc:
+            log.error(f"Error in compact display: {display_exc}")
+            # Fallback to simple display if compact view fails
+            print(f"[magenta]Running tool:[/magenta] {tool_name}")
 
     def _display_compact_tool_calls(self) -> None:
         """Display compact view of tool calls with better error handling."""
@@ -496,7 +601,7 @@ class ChatUIManager:
                 spinner = "*"  # Fallback if spinner fails
 
             # Build parts list with error handling
-            parts: List[str] = []
+            parts: List[Tuple[str, RichStyle]] = []
             try:
                 # Show completed tools
                 for i, t in enumerate(self.tool_calls[:-1]):
@@ -507,10 +612,10 @@ class ChatUIManager:
                             if i < len(self.tool_times)
                             else ""
                         )
-                        parts.append(f"[dim green]{i + 1}. {name}{dur}[/dim green]")
+                        parts.append((f"{i + 1}. {name}{dur}", _DONE_TOOL_STYLE))
                     except Exception as tool_exc:
                         log.warning(f"Error formatting tool entry {i}: {tool_exc}")
-                        parts.append(f"[dim green]{i + 1}. (error)[/dim green]")
+                        parts.append((f"{i + 1}. (error)", _DONE_TOOL_STYLE))
 
                 # Show current tool
                 idx = len(self.tool_calls) - 1
@@ -518,23 +623,29 @@ class ChatUIManager:
                     try:
                         name = self.tool_calls[-1].get("name", "unknown")
                         parts.append(
-                            f"[magenta]{idx + 1}. {name} ({cur_elapsed}s)[/magenta]"
+                            (f"{idx + 1}. {name} ({cur_elapsed}s)", _CURRENT_TOOL_STYLE)
                         )
                     except Exception as curr_exc:
                         log.warning(f"Error formatting current tool: {curr_exc}")
-                        parts.append(f"[magenta]{idx + 1}. (error)[/magenta]")
+                        parts.append((f"{idx + 1}. (error)", _CURRENT_TOOL_STYLE))
             except Exception as parts_exc:
                 log.error(f"Error building parts list: {parts_exc}")
                 # If parts building fails, use minimal display
-                parts = ["[magenta]Processing tools...[/magenta]"]
+                parts = [("Processing tools...", _CURRENT_TOOL_STYLE)]
 
             # Update display with error handling
             try:
-                separator = " → "
-                display_text = Text.from_markup(
-                    f"[dim]Calling tools (total: {total_elapsed}s): {spinner}[/dim] "
-                    + separator.join(parts)
+                display_text = Text.assemble(
+                    (
+                        f"Calling tools (total: {total_elapsed}s): {spinner}",
+                        _TOOL_HEADER_STYLE,
+                    ),
+                    " ",
                 )
+                for n, part in enumerate(parts):
+                    if n:
+                        display_text.append(_TOOL_CHAIN_SEPARATOR)
+                    display_text.append(*part)
                 self.live_display.update(display_text)
             except Exception as update_exc:
                 log.error(f"Error updating live display: {update_exc}")
@@ -622,11 +733,15 @@ class ChatUIManager:
 
             # Display the assistant's response
             try:
+                # Remove <think>...</think> blocks before building the renderable
+                content = _strip_think_tags(content or "")
+
                 # Check if content might contain problematic markup characters
                 needs_text_object = "[/" in content or "\\[" in content
 
-                if needs_text_object:
-                    # Use Text object to prevent markup parsing issues
+                if needs_text_object or not looks_like_markdown(content):
+                    # Use Text object to prevent markup parsing issues, or
+                    # because plain prose doesn't need the Markdown renderer
                     response_content = Text(content or "[No Response]")
                     # response_content = Text(text=(content or "[No Response]"), overflow="fold")
                 else:
@@ -640,15 +755,6 @@ class ChatUIManager:
                         )
                         response_content = Text(content or "[No Response]")
 
-                def remove_think_tags(text):
-                    print(f"Removing thinking tags from content: {text}")
-                    return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
-
-                suppress_thinking = True  # Example flag to control thinking suppression
-                # If suppress_thinking flag and the final answer contains text between <think> and </think>, remove it
-                if suppress_thinking:
-                    response_content = remove_think_tags(response_content)
-
                 print(
                     Panel(
                         response_content,
@@ -660,18 +766,22 @@ class ChatUIManager:
             except Exception as panel_exc:
                 log.error(f"Error creating response panel: {panel_exc}")
                 # Fallback to plain text if rich formatting fails
-                print("\n[bold blue]Assistant:[/bold blue]")
-                print(content or "[No Response]")
-                print(f"[dim]Response time: {elapsed:.2f}s[/dim]")
+                self._print_lines(
+                    "\n[bold blue]Assistant:[/bold blue]",
+                    content or "[No Response]",
+                    f"[dim]Response time: {elapsed:.2f}s[/dim]",
+                )
 
         except Exception as exc:
             # Last-resort error handler
             log.error(f"Error displaying assistant response: {exc}")
             # Use the most basic display possible as fallback
-            print("Assistant:")
-            print(content or "[No Response]")
-            print(f"Response time: {elapsed:.2f}s")
-            print(f"Warning: Error in display: {exc}")
+            self._print_lines(
+                "Assistant:",
+                content or "[No Response]",
+                f"Response time: {elapsed:.2f}s",
+                f"Warning: Error in display: {exc}",
+            )
 
     # ───────────────────────────── commands ─────────────────────────────
     async def handle_command(self, cmd: str) -> bool:
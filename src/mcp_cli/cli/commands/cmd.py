@@ -248,9 +248,12 @@ class CmdCommand(BaseCommand):
                     fp.write("\n")
             return
 
-        # Write to stdout
+        # Write to stdout (plain/raw go straight to the stream, like the file path)
         if plain or raw:
-            print(text, end="" if text.endswith("\n") else "\n")
+            out = sys.stdout
+            out.write(text)
+            if not text.endswith("\n"):
+                out.write("\n")
         else:
             rich_print(text)
 
@@ -10,8 +10,6 @@ import logging
 import time
 from typing import Any, Dict, List, Sequence, Tuple
 
-from chuk_mcp.protocol.messages import send_ping
-
 from chuk_term.ui import output, format_table
 from mcp_cli.tools.manager import ToolManager
 from mcp_cli.utils.async_utils import run_blocking
@@ -89,6 +87,9 @@ async def _ping_server(
     Returns:
         Tuple of (name, success, latency_ms)
     """
+    # Imported here so registering the ping command doesn't load chuk_mcp
+    from chuk_mcp.protocol.messages import send_ping
+
     start = time.perf_counter()
 
     try:
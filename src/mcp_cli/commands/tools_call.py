@@ -48,10 +48,12 @@ async def tools_call_action(tm: ToolManager) -> None:  # noqa: D401
         return
 
     # ── list tools ────────────────────────────────────────────────────
-    cprint("[green]Available tools:[/green]")
+    # One print for the whole listing instead of one render per tool
+    lines = ["[green]Available tools:[/green]"]
     for idx, tool in enumerate(all_tools, 1):
         desc = tool.description or "No description"
-        cprint(f"  {idx}. {tool.name} (from {tool.namespace}) - {desc}")
+        lines.append(f"  {idx}. {tool.name} (from {tool.namespace}) - {desc}")
+    cprint("\n".join(lines))
 
     # ── user selection ────────────────────────────────────────────────
     sel_raw = await asyncio.to_thread(input, "\nEnter tool number to call: ")
@@ -176,8 +176,9 @@ async def tools_manage_action_async(
             output.print("[green]No validation errors[/green]")
         else:
             output.print(f"[red]Found {len(errors)} validation errors:[/red]")
-            for error in errors:
-                output.print(f"  • {error['tool']}: {error['error']}")
+            output.print(
+                "\n".join(f"  • {error['tool']}: {error['error']}" for error in errors)
+            )
 
         return {"success": True, "action": "validation_errors", "errors": errors}
 
@@ -7,6 +7,16 @@ import logging
 import os
 import sys
 
+# format_style -> log record format; unknown styles fall back to "simple"
+_LOG_FORMATS = {
+    "json": (
+        '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
+        '"message": "%(message)s", "logger": "%(name)s"}'
+    ),
+    "detailed": "%(asctime)s [%(levelname)-8s] %(name)s:%(lineno)d - %(message)s",
+    "simple": "%(levelname)-8s %(message)s",
+}
+
 
 def setup_logging(
     level: str = "WARNING",
@@ -44,17 +54,9 @@ def setup_logging(
         root_logger.removeHandler(handler)
 
     # Configure format
-    if format_style == "json":
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"message": "%(message)s", "logger": "%(name)s"}'
-        )
-    elif format_style == "detailed":
-        formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)-8s] %(name)s:%(lineno)d - %(message)s"
-        )
-    else:  # simple
-        formatter = logging.Formatter("%(levelname)-8s %(message)s")
+    formatter = logging.Formatter(
+        _LOG_FORMATS.get(format_style, _LOG_FORMATS["simple"])
+    )
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stderr)
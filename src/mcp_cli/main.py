@@ -41,7 +41,7 @@ from chuk_term.ui import (
     output,
     restore_terminal,
 )
-from chuk_term.ui.theme import set_theme
+from chuk_term.ui.theme import get_theme, set_theme
 
 from mcp_cli.cli_options import process_options
 
@@ -96,12 +96,12 @@ def main_callback(
 
     if theme and theme != "default":
         # User specified theme via command line
-        set_theme(theme)
+        _apply_theme(theme)
         pref_manager.set_theme(theme)  # Save it as preference
     else:
         # Use saved preference
         saved_theme = pref_manager.get_theme()
-        set_theme(saved_theme)
+        _apply_theme(saved_theme)
 
     # If a subcommand was invoked, let it handle things
     if ctx.invoked_subcommand is not None:
@@ -256,12 +256,12 @@ def _interactive_command(
 
     if theme and theme != "default":
         # User specified theme via command line
-        set_theme(theme)
+        _apply_theme(theme)
         pref_manager.set_theme(theme)  # Save it as preference
     else:
         # Use saved preference
         saved_theme = pref_manager.get_theme()
-        set_theme(saved_theme)
+        _apply_theme(saved_theme)
 
     logger.debug("Starting interactive command mode")
 
@@ -369,6 +369,12 @@ def _run_provider_command(args, log_prefix="Provider command"):
         raise typer.Exit(1)
 
 
+def _apply_theme(theme_name: str) -> None:
+    """Switch the UI theme, skipping chuk-term's console rebuild if unchanged."""
+    if get_theme().name != theme_name:
+        set_theme(theme_name)
+
+
 # Function to configure logging for individual commands
 def _setup_command_logging(
     quiet: bool, verbose: bool, log_level: str, theme: str = "default"
@@ -376,7 +382,7 @@ def _setup_command_logging(
     """Set up logging and theme for individual commands."""
     setup_logging(level=log_level, quiet=quiet, verbose=verbose)
     if theme:
-        set_theme(theme)
+        _apply_theme(theme)
 
 
 # Provider command - FIXED to handle arguments properly
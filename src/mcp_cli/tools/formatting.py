@@ -1,10 +1,12 @@
 # mcp_cli/tools/formatting.py
 """Helper functions for tool display and formatting."""
 
-from typing import List, Dict
+import json
+from typing import List, Dict, Optional
 from rich.table import Table
 from chuk_term.ui import output
 from rich.panel import Panel
+from rich.text import Text
 
 from mcp_cli.tools.models import ToolInfo, ServerInfo
 
@@ -102,23 +104,25 @@ def create_servers_table(servers: List[ServerInfo]) -> Table:
     return table
 
 
-def display_tool_call_result(result, console=None):
-    """Display the result of a tool call."""
-    import json
-    from rich.text import Text
+def display_tool_call_result(result, console=None, content: Optional[str] = None):
+    """Display the result of a tool call.
 
+    ``content`` may carry the already-serialized success payload so callers
+    that formatted it for the conversation history don't serialize it twice.
+    """
     # If console is provided, use it; otherwise use output.print
     print_func = console.print if console else output.print
 
     if result.success:
-        # Format successful result
-        if isinstance(result.result, (dict, list)):
-            try:
-                content = json.dumps(result.result, indent=2)
-            except Exception:
+        # Format successful result (unless the caller already did)
+        if content is None:
+            if isinstance(result.result, (dict, list)):
+                try:
+                    content = json.dumps(result.result, indent=2)
+                except Exception:
+                    content = str(result.result)
+            else:
                 content = str(result.result)
-        else:
-            content = str(result.result)
 
         title = f"[green]Tool '{result.tool_name}' - Success"
         if result.execution_time:
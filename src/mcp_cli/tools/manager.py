@@ -17,26 +17,64 @@ import json
 import logging
 import os
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, Union, AsyncIterator
-from pathlib import Path
-
-from chuk_tool_processor.core.processor import ToolProcessor
-from chuk_tool_processor.registry import ToolRegistryProvider
-from chuk_tool_processor.mcp.stream_manager import StreamManager
-from chuk_tool_processor.models.tool_result import ToolResult
-from chuk_tool_processor.models.tool_call import ToolCall
-from chuk_tool_processor.execution.strategies.inprocess_strategy import (
-    InProcessStrategy,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    AsyncIterator,
 )
-from chuk_tool_processor.execution.tool_executor import ToolExecutor
+from pathlib import Path
 
 from mcp_cli.tools.models import ServerInfo, ToolCallResult, ToolInfo
 from mcp_cli.tools.validation import ToolSchemaValidator
 from mcp_cli.tools.filter import ToolFilter
 
+# chuk_tool_processor (and the MCP transports it pulls in) dominates CLI
+# start-up time, so it is only imported once a ToolManager actually needs it.
+if TYPE_CHECKING:
+    from chuk_tool_processor.core.processor import ToolProcessor
+    from chuk_tool_processor.mcp.stream_manager import StreamManager
+    from chuk_tool_processor.models.tool_result import ToolResult
+    from chuk_tool_processor.execution.tool_executor import ToolExecutor
+
 logger = logging.getLogger(__name__)
 
 
+class _EmptyToolProcessor:
+    """Minimal processor stand-in used when no servers are configured."""
+
+    __slots__ = ("tools",)
+
+    def __init__(self):
+        self.tools = {}
+
+    async def execute_tool(self, *args, **kwargs):
+        return {"error": "No tools available"}
+
+    def list_tools(self):
+        return []
+
+    def get_tool(self, name):
+        return None
+
+
+class _EmptyStreamManager:
+    """Minimal stream manager stand-in used when no servers are configured."""
+
+    __slots__ = ()
+
+    async def stream(self, *args, **kwargs):
+        yield {"error": "No streaming available"}
+
+    async def close(self):
+        """No-op close method for compatibility."""
+        pass
+
+
 class ToolManager:
     """
     Central interface for all tool operations in MCP CLI.
@@ -278,34 +316,9 @@ class ToolManager:
     async def _setup_empty_toolset(self) -> bool:
         """Setup an empty tool processor when no servers are configured."""
         try:
-            # Create a minimal mock processor that implements the required interface
-            class EmptyToolProcessor:
-                def __init__(self):
-                    self.tools = {}
-
-                async def execute_tool(self, *args, **kwargs):
-                    return {"error": "No tools available"}
-
-                def list_tools(self):
-                    return []
-
-                def get_tool(self, name):
-                    return None
-
-            class EmptyStreamManager:
-                def __init__(self):
-                    pass
-
-                async def stream(self, *args, **kwargs):
-                    yield {"error": "No streaming available"}
-
-                async def close(self):
-                    """No-op close method for compatibility."""
-                    pass
-
             # Create minimal processor and stream manager with no tools
-            self.processor = EmptyToolProcessor()
-            self.stream_manager = EmptyStreamManager()
+            self.processor = _EmptyToolProcessor()
+            self.stream_manager = _EmptyStreamManager()
 
             logger.info(
                 "Initialized with empty tool set - chat mode available without tools"
@@ -317,6 +330,12 @@ class ToolManager:
 
     async def _setup_common_components(self):
         """Setup components common to all transport types."""
+        from chuk_tool_processor.registry import ToolRegistryProvider
+        from chuk_tool_processor.execution.strategies.inprocess_strategy import (
+            InProcessStrategy,
+        )
+        from chuk_tool_processor.execution.tool_executor import ToolExecutor
+
         self._registry = await asyncio.wait_for(
             ToolRegistryProvider.get_registry(), timeout=30.0
         )
@@ -439,6 +458,8 @@ class ToolManager:
         self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None
     ) -> ToolCallResult:
         """Execute a tool and return the result."""
+        from chuk_tool_processor.models.tool_call import ToolCall
+
         if not isinstance(arguments, dict):
             return ToolCallResult(tool_name, False, error="Arguments must be a dict")
 
@@ -565,11 +586,11 @@ class ToolManager:
         self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None
     ) -> AsyncIterator[ToolResult]:
         """Execute a tool with streaming support."""
+        from chuk_tool_processor.models.tool_result import ToolResult
+        from chuk_tool_processor.models.tool_call import ToolCall
+
         # Check if tool is enabled
         if not self.tool_filter.is_tool_enabled(tool_name):
-            from chuk_tool_processor.models.tool_result import ToolResult
-            from chuk_tool_processor.models.tool_call import ToolCall
-
             disabled_reason = self.tool_filter.get_disabled_tools().get(
                 tool_name, "unknown"
             )
@@ -612,6 +633,8 @@ class ToolManager:
         conversation_history: Optional[List[Dict[str, Any]]] = None,
     ) -> List[ToolResult]:
         """Process tool calls from an LLM."""
+        from chuk_tool_processor.models.tool_call import ToolCall
+
         chuk_calls = []
         call_mapping = {}
 
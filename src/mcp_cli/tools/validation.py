@@ -6,10 +6,14 @@ SIMPLIFIED: Focus on auto-fixing rather than strict validation.
 
 import json
 import logging
+import re
 from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Function names accepted by OpenAI-style function calling
+_FUNCTION_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 class ToolSchemaValidator:
     """Validates tool schemas for compatibility with different LLM providers."""
@@ -41,9 +45,7 @@ class ToolSchemaValidator:
                 return False, "Function name must be a non-empty string"
 
             # Check for forbidden characters in name
-            import re
-
-            if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+            if not _FUNCTION_NAME_RE.match(name):
                 return (
                     False,
                     f"Function name '{name}' contains invalid characters. Only a-z, A-Z, 0-9, _, - allowed",
@@ -6,6 +6,7 @@ model preferences, and other configuration options in a centralized way.
 """
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, asdict, field
@@ -25,6 +26,10 @@ class Theme(str, Enum):
     SOLARIZED = "solarized"
 
 
+# Theme names accepted by set_theme, computed once rather than per call
+_VALID_THEMES = tuple(t.value for t in Theme)
+
+
 @dataclass
 class UIPreferences:
     """UI-related preferences."""
@@ -142,12 +147,14 @@ class PreferenceManager:
             ValueError: If theme is not valid
         """
         # Validate theme
-        valid_themes = [t.value for t in Theme]
-        if theme not in valid_themes:
+        if theme not in _VALID_THEMES:
             raise ValueError(
-                f"Invalid theme: {theme}. Valid themes are: {', '.join(valid_themes)}"
+                f"Invalid theme: {theme}. Valid themes are: {', '.join(_VALID_THEMES)}"
             )
 
+        if self.preferences.ui.theme == theme:
+            return
+
         self.preferences.ui.theme = theme
         self.save_preferences()
 
@@ -302,11 +309,21 @@ class PreferenceManager:
 
 # Global singleton instance
 _preference_manager: Optional[PreferenceManager] = None
+_preference_manager_lock = threading.Lock()
 
 
 def get_preference_manager() -> PreferenceManager:
-    """Get or create the global preference manager instance."""
+    """Get or create the global preference manager instance.
+
+    Uses double-checked locking so concurrent first calls (e.g. from
+    ``asyncio.to_thread`` workers) cannot build two managers, while the
+    steady-state path stays a single global read.
+    """
     global _preference_manager
-    if _preference_manager is None:
-        _preference_manager = PreferenceManager()
-    return _preference_manager
+    manager = _preference_manager
+    if manager is None:
+        with _preference_manager_lock:
+            manager = _preference_manager
+            if manager is None:
+                manager = _preference_manager = PreferenceManager()
+    return manager
@@ -0,0 +1,29 @@
+"""Unit tests for the chat reply formatting helpers."""
+
+import pytest
+
+from mcp_cli.chat.formatting import looks_like_markdown
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Sure, the answer is 42.", False),
+        ("", False),
+        ("# Heading", True),
+        ("some **bold** text", True),
+        ("call `foo()`", True),
+        ("see [link](http://x)", True),
+        ("line one\nline two", True),
+        ("- item one", True),
+        ("+ item", True),
+        ("1. first item", True),
+        ("2) second item", True),
+        ("---", True),
+        ("    indented code", True),
+        ("  leading", True),
+        ("42 is the answer", False),
+    ],
+)
+def test_looks_like_markdown(text: str, expected: bool):
+    assert looks_like_markdown(text) is expected
@@ -0,0 +1,34 @@
+"""Unit tests for StreamingResponseHandler chunk parsing."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from mcp_cli.chat.streaming_handler import StreamingResponseHandler
+
+
+@pytest.fixture()
+def handler():
+    return StreamingResponseHandler(console=object())
+
+
+@pytest.mark.parametrize(
+    "chunk, expected",
+    [
+        ({"response": "hello"}, "hello"),
+        ({"response": None}, ""),
+        ({"content": "c"}, "c"),
+        ({"text": "t"}, "t"),
+        ({"delta": {"content": "d"}}, "d"),
+        ({"choices": [{"delta": {"content": "x"}}]}, "x"),
+        ({"tool_calls": []}, ""),
+        ("raw", "raw"),
+        (OrderedDict(response="sub"), "sub"),
+        (42, ""),
+        (None, ""),
+    ],
+)
+def test_extract_chunk_content(handler, chunk, expected):
+    assert handler._extract_chunk_content(chunk) == expected
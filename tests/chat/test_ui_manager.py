@@ -11,6 +11,7 @@ import pytest
 from prompt_toolkit.document import Document
 
 from mcp_cli.chat.command_completer import ChatCommandCompleter
+from mcp_cli.chat.ui_manager import ChatUIManager, _strip_think_tags
 
 
 @pytest.fixture()
@@ -37,3 +38,88 @@ def test_get_completions(completer, text: str, expect_some: bool):
         assert comps, f"expected suggestions for {text!r}"
     else:
         assert not comps, f"unexpected suggestions for {text!r}"
+
+
+# ---------------------------------------------------------------------------
+# think-tag stripping
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("plain answer", "plain answer"),
+        ("<think>hmm</think>answer", "answer"),
+        ("a<think>x\ny</think>b<think>z</think>c", "abc"),
+        ("before <think>never closed", "before <think>never closed"),
+        ("<think>" * 1000, "<think>" * 1000),
+        ("", ""),
+    ],
+)
+def test_strip_think_tags(text: str, expected: str):
+    assert _strip_think_tags(text) == expected
+
+
+# ---------------------------------------------------------------------------
+# status de-duplication
+# ---------------------------------------------------------------------------
+
+
+def _bare_ui() -> ChatUIManager:
+    """A ChatUIManager with just the state the status helpers need."""
+    ui = ChatUIManager.__new__(ChatUIManager)
+    ui._dedupe_status = True
+    ui._last_status = None
+    return ui
+
+
+def test_print_status_skips_consecutive_repeats(capsys):
+    ui = _bare_ui()
+
+    ui._print_status("Interrupting...")
+    ui._print_status("Interrupting...")
+    ui._print_status("Stopped.")
+    ui._print_status("Interrupting...")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Interrupting...",
+        "Stopped.",
+        "Interrupting...",
+    ]
+
+
+def test_print_status_repeats_after_new_stream_or_tool_batch(capsys):
+    ui = _bare_ui()
+    ui.tool_start_time = None
+    ui.current_tool_start_time = None
+    ui.tool_calls = []
+    ui.interrupt_requested = False
+    ui._install_sigint_handler = lambda: None
+    ui._render_tool_call = lambda name, args: None
+
+    ui._print_status("Interrupt requested")
+    ui.start_streaming_response()
+    ui._print_status("Interrupt requested")
+    ui.print_tool_call("t1", {})
+    ui._print_status("Interrupt requested")
+
+    assert capsys.readouterr().out.splitlines() == ["Interrupt requested"] * 3
+
+
+# ---------------------------------------------------------------------------
+# tool-call renderer selection
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("flag", ["verbose_mode", "confirm_tool_execution"])
+def test_mode_setters_rebind_tool_call_renderer(flag: str):
+    ui = ChatUIManager.__new__(ChatUIManager)
+    ui._verbose_mode = True
+    ui._confirm_tool_execution = True
+
+    ui.verbose_mode = False
+    ui.confirm_tool_execution = False
+    assert ui._render_tool_call == ui._print_tool_call_compact
+
+    setattr(ui, flag, True)
+    assert ui._render_tool_call == ui._print_tool_call_panel
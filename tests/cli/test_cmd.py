@@ -142,3 +142,10 @@ async def test_missing_prompt_and_input():
         typer.BadParameter, match="Either --prompt or --input must be supplied"
     ):
         await cmd.execute(tool_manager=tm, prompt=None, input_file=None)
+
+
+@pytest.mark.parametrize("text", ["plain output", "already newline\n"])
+def test_write_output_raw_stdout(capsys, text):
+    cmd = CmdCommand()
+    cmd._write_output(text, None, raw=True, plain=False)
+    assert capsys.readouterr().out == text.rstrip("\n") + "\n"
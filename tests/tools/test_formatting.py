@@ -154,3 +154,12 @@ def test_display_tool_call_failure(result):
     # error message
     expected = result.error or "Unknown error"
     assert expected in text
+
+
+def test_display_tool_call_success_uses_preformatted_content():
+    result = ToolCallResult(tool_name="foo", success=True, result={"x": 1}, error=None)
+    console = Console(record=True)
+    display_tool_call_result(result, console=console, content="pre-rendered")
+    text = console.export_text()
+    assert "pre-rendered" in text
+    assert '"x"' not in text
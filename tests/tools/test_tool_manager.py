@@ -1,20 +1,25 @@
 # tests/mcp_cli/tool/test_tool_processor.py
+import asyncio
 import pytest
-import json
-from typing import Dict, List, Tuple
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple
 
 from mcp_cli.tools.manager import ToolManager
 from mcp_cli.tools.models import ToolInfo
 
+_ns_name = attrgetter("namespace", "name")
 
-class DummyMeta:
+EXPECTED_ALL = frozenset({("ns1", "t1"), ("ns2", "t2"), ("default", "t1")})
+EXPECTED_UNIQUE = frozenset({("ns1", "t1"), ("ns2", "t2")})
+
+
+class DummyMeta(NamedTuple):
     """Simple object mimicking the real metadata objects returned by a registry."""
 
-    def __init__(self, description, argument_schema, is_async=False, tags=None):
-        self.description = description
-        self.argument_schema = argument_schema
-        self.is_async = is_async
-        self.tags = tags or set()
+    description: str
+    argument_schema: Dict[str, Any]
+    is_async: bool = False
+    tags: FrozenSet[str] = frozenset()
 
 
 class DummyRegistry:
@@ -23,7 +28,8 @@ class DummyRegistry:
     def __init__(self, items: List[Tuple[str, str]]):
         # items is a list of ``(namespace, name)`` pairs
         self._items = items
-        self._meta: Dict[Tuple[str, str], DummyMeta] = {}
+        # namespace -> name -> metadata, so lookups don't build a key tuple
+        self._meta: Dict[str, Dict[str, DummyMeta]] = {}
 
     # ------------------------------------------------------------------ #
     # Async API expected by ToolManager
@@ -32,153 +38,123 @@ class DummyRegistry:
         return self._items
 
     async def get_metadata(self, name, ns):
-        return self._meta.get((ns, name))
-
+        by_name = self._meta.get(ns)
+        return by_name.get(name) if by_name else None
 
-@pytest.fixture
-def manager(monkeypatch):
-    """Return a ToolManager instance whose registry is replaced by DummyRegistry."""
-    tm = ToolManager(config_file="dummy", servers=[])
 
-    # Provide predictable data
-    dummy = DummyRegistry([("ns1", "t1"), ("ns2", "t2"), ("default", "t1")])
-    dummy._meta[("ns1", "t1")] = DummyMeta(
-        "d1",
-        {"properties": {"a": {"type": "int"}}, "required": ["a"]},
+# Predictable registry data, built once at import; no test mutates it
+_SHARED_REGISTRY = DummyRegistry([("ns1", "t1"), ("ns2", "t2"), ("default", "t1")])
+_SHARED_REGISTRY._meta["ns1"] = {
+    "t1": DummyMeta(
+        description="d1",
+        argument_schema={"properties": {"a": {"type": "int"}}, "required": ["a"]},
         is_async=True,
-        tags={"x"},
+        tags=frozenset({"x"}),
     )
-    dummy._meta[("ns2", "t2")] = DummyMeta("d2", {}, is_async=False, tags=set())
-
-    # Monkey‑patch in the dummy registry
-    monkeypatch.setattr(tm, "_registry", dummy)
-    return tm
+}
+_SHARED_REGISTRY._meta["ns2"] = {
+    "t2": DummyMeta(description="d2", argument_schema={}, is_async=False)
+}
 
 
-# ----------------------------------------------------------------------------
-# Async Tool‑manager helpers
-# ----------------------------------------------------------------------------
+def _assert_openai_tool_shape(f):
+    """Check *f* is an OpenAI function-tool definition."""
+    func = f["function"]
+    assert f["type"] == "function"
+    assert "description" in func
+    assert isinstance(func.get("parameters"), dict)
 
 
-@pytest.mark.asyncio
-async def test_get_all_tools(manager):
-    tools = await manager.get_all_tools()
-    names = {(t.namespace, t.name) for t in tools}
-    assert names == {("ns1", "t1"), ("ns2", "t2"), ("default", "t1")}
-
-
-@pytest.mark.asyncio
-async def test_get_unique_tools(manager):
-    unique = await manager.get_unique_tools()
-    names = {(t.namespace, t.name) for t in unique}
-    assert names == {("ns1", "t1"), ("ns2", "t2")}
-
-
-@pytest.mark.asyncio
-async def test_get_tool_by_name_with_ns(manager):
-    tool = await manager.get_tool_by_name("t1", namespace="ns1")
-    assert isinstance(tool, ToolInfo)
-    assert (tool.namespace, tool.name) == ("ns1", "t1")
+@pytest.fixture(scope="module")
+def manager():
+    """Return a ToolManager instance whose registry is the shared DummyRegistry.
 
+    Built once per module: the tests below only read from the manager.
+    """
+    tm = ToolManager(config_file="dummy", servers=[])
 
-@pytest.mark.asyncio
-async def test_get_tool_by_name_without_ns(manager):
-    tool = await manager.get_tool_by_name("t2")
-    assert (tool.namespace, tool.name) == ("ns2", "t2")
+    # Monkey‑patch in the dummy registry
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tm, "_registry", _SHARED_REGISTRY)
+        yield tm
 
 
 # ----------------------------------------------------------------------------
-# Static helpers that do *not* require async
+# Async Tool‑manager helpers
 # ----------------------------------------------------------------------------
 
 
-def test_format_tool_response_text_records():
-    payload = [{"type": "text", "text": "foo"}, {"type": "text", "text": "bar"}]
-    out = ToolManager.format_tool_response(payload)
-    assert out == "foo\nbar"
-
-
-def test_format_tool_response_data_records():
-    payload = [{"x": 1}, {"y": 2}]
-    out = ToolManager.format_tool_response(payload)
-    data = json.loads(out)
-    assert data == payload
-
-
-def test_format_tool_response_dict():
-    payload = {"a": 1}
-    out = ToolManager.format_tool_response(payload)
-    assert json.loads(out) == payload
-
+@pytest.mark.asyncio
+async def test_manager_batch(manager):
+    """Run the read-only manager queries concurrently on the shared manager."""
+    (
+        tools,
+        unique,
+        tool_ns,
+        tool_no_ns,
+        fn_defs,
+        (openai_fns, openai_mapping),
+        (ollama_fns, ollama_mapping),
+    ) = await asyncio.gather(
+        manager.get_all_tools(),
+        manager.get_unique_tools(),
+        manager.get_tool_by_name("t1", namespace="ns1"),
+        manager.get_tool_by_name("t2"),
+        manager.get_tools_for_llm(),
+        manager.get_adapted_tools_for_llm(provider="openai"),
+        manager.get_adapted_tools_for_llm(provider="ollama"),
+    )
 
-def test_format_tool_response_other():
-    assert ToolManager.format_tool_response(123) == "123"
+    # get_all_tools / get_unique_tools
+    assert set(map(_ns_name, tools)) == EXPECTED_ALL
+    assert set(map(_ns_name, unique)) == EXPECTED_UNIQUE
 
+    # get_tool_by_name with and without a namespace
+    assert isinstance(tool_ns, ToolInfo)
+    assert _ns_name(tool_ns) == ("ns1", "t1")
+    assert _ns_name(tool_no_ns) == ("ns2", "t2")
 
-# Skip tests for non-existent method
-@pytest.mark.skip(reason="convert_to_openai_tools method no longer exists")
-def test_convert_to_openai_tools_unchanged():
-    pass
+    # get_tools_for_llm - tools no longer have namespace prefixes
+    assert {f["function"]["name"] for f in fn_defs} == {"t1", "t2"}
+    for f in fn_defs:
+        _assert_openai_tool_shape(f)
 
+    # OpenAI adaptation uses identity mapping - no sanitization
+    for adapted, original in openai_mapping.items():
+        assert adapted == original
+    assert {f["function"]["name"] for f in openai_fns} == set(openai_mapping.keys())
+    for f in openai_fns:
+        _assert_openai_tool_shape(f)
 
-@pytest.mark.skip(reason="convert_to_openai_tools method no longer exists")
-def test_convert_to_openai_tools_conversion():
-    pass
+    # Non-OpenAI providers also return identity mapping
+    assert ollama_mapping == {"t1": "t1", "t2": "t2"}
+    assert {f["function"]["name"] for f in ollama_fns} == {"t1", "t2"}
+    for f in ollama_fns:
+        _assert_openai_tool_shape(f)
 
 
 # ----------------------------------------------------------------------------
-# LLM tools helpers - async again
+# Static helpers that do *not* require async
 # ----------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_get_tools_for_llm(manager):
-    fn_defs = await manager.get_tools_for_llm()
-    names = {f["function"]["name"] for f in fn_defs}
-    # Tools no longer have namespace prefixes - they use direct names
-    assert names == {"t1", "t2"}
-    # Ensure basic structure
-    for f in fn_defs:
-        assert f["type"] == "function"
-        assert "description" in f["function"]
-        assert isinstance(f["function"]["parameters"], dict)
-
-
-@pytest.mark.asyncio
-async def test_get_adapted_tools_for_llm_openai(manager):
-    fns, mapping = await manager.get_adapted_tools_for_llm(provider="openai")
-
-    # The new implementation uses identity mapping - no sanitization
-    # Tools are passed through with their original names
-    for adapted, original in mapping.items():
-        assert mapping[adapted] == original
-        # No dots or namespace prefixes expected anymore
-        assert adapted == original  # Identity mapping
-
-    # 2. The functions list should have the same names as in the mapping
-    fn_names = {f["function"]["name"] for f in fns}
-    assert fn_names == set(mapping.keys())
+_TEXT_RECORDS = [{"type": "text", "text": "foo"}, {"type": "text", "text": "bar"}]
+_DATA_RECORDS = [{"x": 1}, {"y": 2}]
+_DICT_PAYLOAD = {"a": 1}
 
-    # 3. Each definition must conform to OpenAI function tool format
-    for f in fns:
-        assert f["type"] == "function"
-        assert "description" in f["function"]
-        assert "parameters" in f["function"]
 
+@pytest.mark.parametrize(
+    "payload, expected, is_json",
+    [
+        (_TEXT_RECORDS, "foo\nbar", False),
+        (_DATA_RECORDS, _DATA_RECORDS, True),
+        (_DICT_PAYLOAD, _DICT_PAYLOAD, True),
+        (123, "123", False),
+    ],
+    ids=["text_records", "data_records", "dict", "other"],
+)
+def test_format_tool_response(payload, expected, is_json):
+    import json
 
-@pytest.mark.asyncio
-async def test_get_adapted_tools_for_llm_other_provider(manager):
-    # Non-OpenAI providers now also return identity mapping
-    fns, mapping = await manager.get_adapted_tools_for_llm(provider="ollama")
-
-    # Identity mapping for non-OpenAI providers
-    assert mapping == {"t1": "t1", "t2": "t2"}
-
-    names = {f["function"]["name"] for f in fns}
-    # Direct tool names without namespace prefixes
-    assert names == {"t1", "t2"}
-
-    for f in fns:
-        assert f["type"] == "function"
-        assert "description" in f["function"]
-        assert "parameters" in f["function"]
+    out = ToolManager.format_tool_response(payload)
+    assert (json.loads(out) if is_json else out) == expected
@@ -156,6 +156,17 @@ class TestPreferenceManager:
             new_manager = PreferenceManager(config_dir=config_dir)
             assert new_manager.get_theme() == "monokai"
 
+    def test_set_same_theme_skips_save(self):
+        """Test re-setting the current theme doesn't rewrite the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir) / ".mcp-cli"
+            manager = PreferenceManager(config_dir=config_dir)
+            manager.set_theme("dark")
+
+            with patch.object(manager, "save_preferences") as mock_save:
+                manager.set_theme("dark")
+                mock_save.assert_not_called()
+
     def test_set_invalid_theme(self):
         """Test setting invalid theme raises error."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -406,3 +417,32 @@ class TestSingletonManager:
         manager1 = get_preference_manager()
         manager2 = get_preference_manager()
         assert manager1 is manager2
+
+    @patch("mcp_cli.utils.preferences.PreferenceManager")
+    def test_get_preference_manager_thread_safe(self, mock_manager_class):
+        """Test that concurrent first calls construct a single instance."""
+        import threading
+        import time
+
+        import mcp_cli.utils.preferences
+
+        def slow_init():
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_manager_class.side_effect = slow_init
+        mcp_cli.utils.preferences._preference_manager = None
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_preference_manager()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_manager_class.call_count == 1
+        assert all(r is results[0] for r in results)
+        mcp_cli.utils.preferences._preference_manager = None